@@ -0,0 +1,76 @@
+from yomika.classes import ScrapedResponse
+from yomika.modules.cache import ResponseCache
+
+
+def make_response(url='https://example.com', headers=None):
+    return ScrapedResponse(
+        url=url,
+        status_code=200,
+        content=b'<html></html>',
+        headers=headers or {},
+        elapsed_time=0.1,
+        content_type='text/html',
+        success=True
+    )
+
+
+def test_make_key_normalizes_method_and_headers():
+    key_a = ResponseCache.make_key('get', 'https://example.com', {'A': '1', 'B': '2'})
+    key_b = ResponseCache.make_key('GET', 'https://example.com', {'B': '2', 'A': '1'})
+    assert key_a == key_b
+
+
+def test_fresh_entry_is_replayed():
+    cache = ResponseCache()
+    key = cache.make_key('GET', 'https://example.com')
+    response = make_response(headers={'Cache-Control': 'max-age=60'})
+    cache.set(key, response)
+    assert cache.get(key) is response
+
+
+def test_no_store_is_not_cached():
+    cache = ResponseCache()
+    key = cache.make_key('GET', 'https://example.com')
+    cache.set(key, make_response(headers={'Cache-Control': 'no-store'}))
+    assert cache.get(key) is None
+    assert cache.get_stale(key) is None
+
+
+def test_uncacheable_without_lifetime_or_etag():
+    cache = ResponseCache()
+    key = cache.make_key('GET', 'https://example.com')
+    cache.set(key, make_response(headers={}))
+    assert cache.get_stale(key) is None
+
+
+def test_etag_entry_is_stale_but_revalidatable():
+    cache = ResponseCache()
+    key = cache.make_key('GET', 'https://example.com')
+    response = make_response(headers={'ETag': '"abc123"'})
+    cache.set(key, response)
+    # No freshness lifetime: not served directly, but available for a
+    # conditional GET and a 304 replay
+    assert cache.get(key) is None
+    assert cache.get_etag(key) == '"abc123"'
+    assert cache.get_stale(key) is response
+
+
+def test_refresh_extends_lifetime_after_304():
+    cache = ResponseCache()
+    key = cache.make_key('GET', 'https://example.com')
+    response = make_response(headers={'ETag': '"abc123"'})
+    cache.set(key, response)
+    assert cache.get(key) is None
+    cache.refresh(key, {'Cache-Control': 'max-age=60'})
+    assert cache.get(key) is response
+
+
+def test_lru_eviction_drops_oldest_entry():
+    cache = ResponseCache(maxsize=2)
+    headers = {'Cache-Control': 'max-age=60'}
+    keys = [cache.make_key('GET', f'https://example.com/{i}') for i in range(3)]
+    for key in keys:
+        cache.set(key, make_response(headers=headers))
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[1]) is not None
+    assert cache.get(keys[2]) is not None
@@ -0,0 +1,69 @@
+import asyncio
+import http.server
+import threading
+import time
+
+import pytest
+
+from yomika.webscrape_requests import webscrape_requests
+from yomika.webscrape_aiohttp import webscrape_aiohttp, close_all_sessions
+
+
+class RateLimitOnceHandler(http.server.BaseHTTPRequestHandler):
+    """Answer the first request with 429 + Retry-After, then 200."""
+
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        if type(self).hits == 1:
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+        else:
+            body = b'<html>ok</html>'
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def rate_limited_server():
+    RateLimitOnceHandler.hits = 0
+    server = http.server.HTTPServer(('127.0.0.1', 0), RateLimitOnceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}/'
+    server.shutdown()
+
+
+def test_requests_backend_honours_retry_after(rate_limited_server):
+    start = time.monotonic()
+    result = webscrape_requests(rate_limited_server)
+    elapsed = time.monotonic() - start
+    assert result.success
+    assert result.status_code == 200
+    assert RateLimitOnceHandler.hits == 2
+    # The retry must wait out the server's Retry-After, not the expo schedule
+    assert elapsed >= 1.0
+
+
+def test_aiohttp_backend_honours_retry_after(rate_limited_server):
+    async def scrape():
+        try:
+            return await webscrape_aiohttp(rate_limited_server)
+        finally:
+            await close_all_sessions()
+
+    start = time.monotonic()
+    result = asyncio.run(scrape())
+    elapsed = time.monotonic() - start
+    assert result.success
+    assert result.status_code == 200
+    assert RateLimitOnceHandler.hits == 2
+    assert elapsed >= 1.0
@@ -0,0 +1,67 @@
+import time
+
+from yomika.modules.rate_limiter import (
+    RequestRateLimiter,
+    AdaptiveRateLimiter,
+    SlidingWindowRateLimiter,
+)
+
+
+def test_token_bucket_burst_within_capacity_is_free():
+    limiter = RequestRateLimiter(requests_per_second=5, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        limiter.wait('example.com')
+    assert time.monotonic() - start < 0.1
+
+
+def test_token_bucket_blocks_once_exhausted():
+    limiter = RequestRateLimiter(requests_per_second=10, capacity=1)
+    limiter.wait('example.com')
+    start = time.monotonic()
+    limiter.wait('example.com')
+    assert time.monotonic() - start >= 0.05
+
+
+def test_token_bucket_is_per_host():
+    limiter = RequestRateLimiter(requests_per_second=10, capacity=1)
+    limiter.wait('slow.example.com')
+    start = time.monotonic()
+    limiter.wait('other.example.com')
+    assert time.monotonic() - start < 0.05
+
+
+def test_adaptive_halves_rate_on_429_with_floor():
+    limiter = AdaptiveRateLimiter(requests_per_second=8, min_rate=1.0)
+    limiter.observe(429)
+    assert limiter.refill_rate == 4
+    for _ in range(10):
+        limiter.observe(429)
+    assert limiter.refill_rate == limiter.min_rate
+
+
+def test_adaptive_restores_rate_after_success_streak():
+    limiter = AdaptiveRateLimiter(requests_per_second=8, increase_step=1.0, increase_after=3)
+    limiter.observe(503)
+    assert limiter.refill_rate == 4
+    for _ in range(3):
+        limiter.observe(200)
+    assert limiter.refill_rate == 5
+
+
+def test_adaptive_honours_numeric_retry_after_as_hold():
+    limiter = AdaptiveRateLimiter(requests_per_second=100)
+    limiter.observe(429, retry_after='0.2')
+    start = time.monotonic()
+    limiter.wait('example.com')
+    assert time.monotonic() - start >= 0.2
+
+
+def test_sliding_window_blocks_at_limit():
+    limiter = SlidingWindowRateLimiter(limit=3, window_size=0.2)
+    start = time.monotonic()
+    for _ in range(3):
+        limiter.wait()
+    assert time.monotonic() - start < 0.1
+    limiter.wait()
+    assert time.monotonic() - start >= 0.1
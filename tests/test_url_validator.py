@@ -0,0 +1,27 @@
+from yomika.modules.url_validator import is_valid_url, _is_valid_url_cached
+
+
+def test_common_urls_fast_path():
+    is_valid_url.cache_clear()
+    assert is_valid_url('https://example.com')
+    assert is_valid_url('http://example.com/path?q=1')
+    assert not is_valid_url('https://')
+    assert not is_valid_url('not-a-url')
+    assert not is_valid_url('ftp://files.example.com')
+
+
+def test_results_are_memoized():
+    is_valid_url.cache_clear()
+    is_valid_url('https://example.com')
+    misses = _is_valid_url_cached.cache_info().misses
+    is_valid_url('https://example.com')
+    info = _is_valid_url_cached.cache_info()
+    assert info.misses == misses
+    assert info.hits >= 1
+
+
+def test_strict_validator_rejects_ip_and_missing_tld():
+    is_valid_url.cache_clear()
+    assert is_valid_url('https://example.com', strict=True, validator='self')
+    assert not is_valid_url('https://192.168.1.1', strict=True, validator='self')
+    assert not is_valid_url('https://example', strict=True, validator='self')
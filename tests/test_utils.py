@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from yomika.exceptions import RateLimitExceededError
+from yomika.modules.utils import (
+    parse_retry_after,
+    retry_after_wait,
+    content_type_matches,
+    safe_callback,
+)
+
+
+def test_parse_retry_after_numeric_seconds():
+    assert parse_retry_after('120') == 120.0
+    assert parse_retry_after('1.5') == 1.5
+
+
+def test_parse_retry_after_clamps_negative_to_zero():
+    assert parse_retry_after('-5') == 0.0
+
+
+def test_parse_retry_after_http_date():
+    future = datetime.now(timezone.utc) + timedelta(seconds=60)
+    delay = parse_retry_after(format_datetime(future, usegmt=True))
+    assert 55 <= delay <= 61
+
+
+def test_parse_retry_after_missing_or_garbage():
+    assert parse_retry_after(None) is None
+    assert parse_retry_after('') is None
+    assert parse_retry_after('not-a-date') is None
+
+
+def test_retry_after_wait_uses_server_value():
+    exception = RateLimitExceededError('Rate limit exceeded: 429', retry_after=3.0)
+    assert retry_after_wait(exception) == 3.0
+
+
+def test_retry_after_wait_falls_back_to_jitter():
+    exception = RateLimitExceededError('Rate limit exceeded: 429')
+    assert 0.5 <= retry_after_wait(exception) <= 2.0
+
+
+def test_content_type_matches_ignores_parameters():
+    assert content_type_matches('text/html', 'text/html; charset=utf-8')
+    assert content_type_matches('text/html', 'TEXT/HTML')
+    assert not content_type_matches('text/html', 'text/html+xml')
+    assert not content_type_matches('text/html', 'application/json')
+
+
+def test_content_type_bare_type_matches_any_subtype():
+    assert content_type_matches('text', 'text/plain; charset=utf-8')
+    assert not content_type_matches('text', 'application/json')
+
+
+def test_safe_callback_invokes_and_swallows_errors():
+    received = []
+    safe_callback(received.append, 'result', 'on_success')
+    assert received == ['result']
+
+    def broken(result):
+        raise ValueError('callback bug')
+
+    # Must not propagate: a buggy callback shouldn't fail the scrape
+    safe_callback(broken, 'result', 'on_success')
+    safe_callback(None, 'result', 'on_success')
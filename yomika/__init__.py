@@ -1,23 +1,32 @@
 from .__version__ import __version__
 
 from .webscrape_requests import webscrape_requests
-from .webscrape_aiohttp import webscrape_aiohttp
-from .processors import scrape_url_list_sync, scrape_url_list_async
+from .webscrape_aiohttp import webscrape_aiohttp, webscrape_aiohttp_many
+from .webscrape_httpx import webscrape_httpx
+from .processors import scrape_url_list_sync, scrape_url_list_async, scrape_url_stream_async, use_uvloop
 from .classes import WebscrapeConfig, ScrapedResponse
 from .defaults import Defaults
-from .modules.rate_limiter import RequestRateLimiter
+from .modules.cache import ResponseCache
+from .modules.rate_limiter import RequestRateLimiter, AdaptiveRateLimiter, SlidingWindowRateLimiter
 from .modules.url_validator import URLValidator, is_valid_url
 from .modules.check_connectivity import InternetConnectivityChecker, is_connected
 
 __all__ = [
     "webscrape_requests",
     "webscrape_aiohttp",
+    "webscrape_aiohttp_many",
+    "webscrape_httpx",
     "scrape_url_list_sync",
     "scrape_url_list_async",
+    "scrape_url_stream_async",
+    "use_uvloop",
     "WebscrapeConfig",
     "ScrapedResponse",
     "Defaults",
+    "ResponseCache",
     "RequestRateLimiter",
+    "AdaptiveRateLimiter",
+    "SlidingWindowRateLimiter",
     "URLValidator",
     "is_valid_url",
     "InternetConnectivityChecker",
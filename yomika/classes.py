@@ -1,30 +1,97 @@
-from dataclasses import dataclass
-from typing import Dict, Optional, Any
+import re
+from dataclasses import dataclass, field
+from typing import Dict, Literal, Mapping, Optional, Any
 
-from .defaults import Defaults
+from .defaults import DEFAULT_HTTP_HEADERS, DEFAULT_REQ_TIMEOUT, DEFAULT_MAX_CONCURRENCY, DEFAULT_CHUNK_SIZE
+from .modules.cache import ResponseCache
 from .modules.rate_limiter import RequestRateLimiter
 
-@dataclass
+@dataclass(slots=True)
 class WebscrapeConfig:
     custom_headers: Optional[Dict[str, str]] = None
     params: Optional[Dict[str, Any]] = None
     cookies: Optional[Dict[str, str]] = None
-    timeout: int = Defaults.DEFAULT_REQ_TIMEOUT
+    timeout: int = DEFAULT_REQ_TIMEOUT
     allow_redirects: bool = True
     verify_ssl: bool = True
     expected_content_type: Optional[str] = None
     proxy: Optional[str] = None
-    rate_limiter: Optional["RequestRateLimiter"] = RequestRateLimiter()
+    rate_limiter: Optional["RequestRateLimiter"] = field(default_factory=RequestRateLimiter)
+    cache: Optional[ResponseCache] = None
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY
+    backend: Literal['aiohttp', 'httpx'] = 'aiohttp'
+    stream: bool = False
+    chunk_size: int = DEFAULT_CHUNK_SIZE
+    snapshot_headers: bool = False
+    # Cached request kwargs shared by every call using this config; rebuilt
+    # lazily after any field assignment (see __setattr__)
+    _aiohttp_kwargs: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
-@dataclass
+    def __setattr__(self, name, value):
+        # Any field change invalidates the cached kwargs built from it
+        if name != '_aiohttp_kwargs':
+            object.__setattr__(self, '_aiohttp_kwargs', None)
+        object.__setattr__(self, name, value)
+
+    def _aiohttp_request_kwargs(self) -> Dict[str, Any]:
+        """Request kwargs that don't vary per URL, built once and reused.
+
+        In batch scrapes the config is constant across thousands of calls, so
+        the per-request dict build (and the proxy branch) happens once here
+        instead of in the hot path; only the URL and timeout vary per call.
+        """
+        kwargs = self._aiohttp_kwargs
+        if kwargs is None:
+            kwargs = {
+                'headers': self.custom_headers or DEFAULT_HTTP_HEADERS,
+                'params': self.params,
+                'cookies': self.cookies,
+                'allow_redirects': self.allow_redirects,
+            }
+            if self.proxy:
+                kwargs['proxy'] = self.proxy
+            # Verification normally lives on the registry session's connector,
+            # but callers passing their own session never go through the
+            # registry — disable per-request too so verify_ssl=False holds
+            if not self.verify_ssl:
+                kwargs['ssl'] = False
+            object.__setattr__(self, '_aiohttp_kwargs', kwargs)
+        return kwargs
+
+# Charset token in a Content-Type header, e.g. 'text/html; charset=utf-8'
+_CHARSET_PATTERN = re.compile(r'charset=([^\s;]+)')
+
+@dataclass(slots=True, frozen=True)
 class ScrapedResponse:
-    """Data class for storing scraping results with metadata."""
+    """Data class for storing scraping results with metadata.
+
+    Frozen and slotted: instances carry no per-object __dict__, and being
+    immutable they are safe to share (the batch processors return one object
+    for duplicate URLs). The decoded body is exposed as the lazy ``text``
+    property, computed from ``content`` on first access so batch scrapes don't
+    hold two copies of every payload in memory.
+    """
     url: str
     status_code: int
     content: bytes
-    text: str
-    headers: Dict[str, str]
+    # The client library's own (case-insensitive) mapping by default; an
+    # immutable copy when the request was made with snapshot_headers=True
+    headers: Mapping[str, str]
     elapsed_time: float
     content_type: str
     success: bool
     error: Optional[str] = None
+    charset: Optional[str] = None
+    _text: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def text(self) -> str:
+        """Response body decoded with the declared charset (utf-8 fallback)."""
+        if self._text is None:
+            charset = self.charset
+            if not charset and self.content_type:
+                charset_match = _CHARSET_PATTERN.search(self.content_type)
+                if charset_match:
+                    charset = charset_match.group(1).strip('"\'')
+            object.__setattr__(self, '_text', self.content.decode(charset or 'utf-8', errors='replace'))
+        return self._text
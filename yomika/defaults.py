@@ -1,27 +1,34 @@
-from dataclasses import dataclass
+from types import MappingProxyType, SimpleNamespace
 
-@dataclass
-class Defaults:
-        _instance = None
+DEFAULT_HTTP_HEADERS = MappingProxyType({
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Cache-Control': 'max-age=0',
+})
 
-        def __new__(cls, *args, **kwargs):
-                """This class method ensures that only one instance of the class exists"""
-                if cls._instance is None:
-                        cls._instance = super(Defaults, cls).__new__(cls)
-                return cls._instance
+DEFAULT_REQ_TIMEOUT = 30
 
-        DEFAULT_HTTP_HEADERS = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-                'Cache-Control': 'max-age=0',
-            }
+# Status codes treated as server-side rate limiting; frozenset membership is
+# a hash probe rather than a tuple scan, and the set is built once
+RATE_LIMIT_STATUS_CODES = frozenset({429, 503})
+DEFAULT_RPS_LIMIT = 250
+DEFAULT_MAX_CONCURRENCY = 50
+DEFAULT_CHUNK_SIZE = 64 * 1024
 
-        DEFAULT_REQ_TIMEOUT = 30
-        DEFAULT_RPS_LIMIT = 250
+# backoff-retry
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_MAX_TIME = 90
 
-        # backoff-retry
-        DEFAULT_MAX_RETRIES = 3
-        DEFAULT_MAX_TIME = 90
\ No newline at end of file
+# Backward-compatible namespace for callers using Defaults.DEFAULT_*
+Defaults = SimpleNamespace(
+    DEFAULT_HTTP_HEADERS=DEFAULT_HTTP_HEADERS,
+    DEFAULT_REQ_TIMEOUT=DEFAULT_REQ_TIMEOUT,
+    DEFAULT_RPS_LIMIT=DEFAULT_RPS_LIMIT,
+    DEFAULT_MAX_CONCURRENCY=DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_CHUNK_SIZE=DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_RETRIES=DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_TIME=DEFAULT_MAX_TIME,
+)
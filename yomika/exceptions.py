@@ -7,8 +7,14 @@ class WebPageLoadError(Exception):
     pass
 
 class RateLimitExceededError(Exception):
-    """Exception raised when rate limit is exceeded."""
-    pass
+    """Exception raised when rate limit is exceeded.
+
+    Carries the parsed Retry-After delay in seconds when the server sent one,
+    so retries can wait exactly as long as asked instead of guessing.
+    """
+    def __init__(self, message: str = '', retry_after: float = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 class ContentTypeError(Exception):
     """Exception raised when the content type is unexpected."""
@@ -0,0 +1,125 @@
+import re
+import time
+import threading
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+from typing import Optional, Tuple, Dict, Any
+
+_MAX_AGE_PATTERN = re.compile(r'max-age=(\d+)')
+_NO_STORE_PATTERN = re.compile(r'no-store|no-cache')
+
+
+class ResponseCache:
+    """LRU cache for scraped responses honoring Cache-Control, Expires and ETag.
+
+    Fresh entries (within their max-age/Expires lifetime) are replayed without
+    any network I/O. Stale entries that carried an ETag can be revalidated by
+    the scrapers with a conditional GET (If-None-Match); a 304 answer refreshes
+    the entry and returns the cached body.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize the response cache.
+
+        Args:
+            maxsize: Maximum number of responses to keep before evicting the
+                least recently used entry
+        """
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(method: str, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple:
+        """Build a cache key from the request method, URL and normalized headers."""
+        normalized_headers = tuple(sorted((headers or {}).items()))
+        return method.upper(), url, normalized_headers
+
+    def get(self, key: Tuple):
+        """Return the cached response for a key if it is still fresh, else None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at = entry['expires_at']
+            if expires_at is not None and time.monotonic() < expires_at:
+                self._entries.move_to_end(key)
+                return entry['response']
+            return None
+
+    def get_etag(self, key: Tuple) -> Optional[str]:
+        """Return the stored ETag for a (possibly stale) entry, for conditional GETs."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry['etag'] if entry else None
+
+    def get_stale(self, key: Tuple):
+        """Return the cached response regardless of freshness, for 304 replays."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry['response'] if entry else None
+
+    def set(self, key: Tuple, response) -> None:
+        """Store a ScrapedResponse, deriving its lifetime from the response headers."""
+        headers = response.headers or {}
+        cache_control = headers.get('Cache-Control', '')
+
+        if _NO_STORE_PATTERN.search(cache_control):
+            return
+
+        lifetime = self._freshness_lifetime(headers)
+        etag = headers.get('ETag')
+
+        # Entries with neither a lifetime nor an ETag can never be reused
+        if lifetime is None and etag is None:
+            return
+
+        expires_at = time.monotonic() + lifetime if lifetime is not None else None
+
+        with self._lock:
+            self._entries[key] = {
+                'response': response,
+                'expires_at': expires_at,
+                'etag': etag,
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def refresh(self, key: Tuple, headers: Optional[Dict[str, str]] = None) -> None:
+        """Extend an entry's lifetime after a 304 Not Modified revalidation."""
+        lifetime = self._freshness_lifetime(headers or {})
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            if lifetime is not None:
+                entry['expires_at'] = time.monotonic() + lifetime
+            self._entries.move_to_end(key)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
+
+    @staticmethod
+    def _freshness_lifetime(headers: Dict[str, str]) -> Optional[float]:
+        """Compute the freshness lifetime in seconds from Cache-Control/Expires."""
+        cache_control = headers.get('Cache-Control', '')
+        max_age_match = _MAX_AGE_PATTERN.search(cache_control)
+        if max_age_match:
+            return float(max_age_match.group(1))
+
+        expires = headers.get('Expires')
+        if expires:
+            try:
+                expires_dt = parsedate_to_datetime(expires)
+                date_header = headers.get('Date')
+                base_dt = parsedate_to_datetime(date_header) if date_header else None
+                if base_dt is not None:
+                    return max(0.0, (expires_dt - base_dt).total_seconds())
+            except (TypeError, ValueError):
+                return None
+
+        return None
@@ -1,11 +1,13 @@
+import asyncio
+import functools
 import socket
 import logging
-import urllib.request
 import requests
-import time
+import aiohttp
+import backoff
 import sys
+import time
 from typing import List, Dict, Union, Tuple, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Configure logging
 logging.basicConfig(
@@ -41,6 +43,23 @@ DEFAULT_CONFIG = {
 }
 
 
+# How long cached resolutions stay valid, in seconds
+_RESOLVE_TTL = 300
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_cached(host: str, port: int, ttl_bucket: int):
+    return socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+
+
+def _resolve(host: str, port: int):
+    """Resolve a host/port to addrinfo tuples, cached so retries and repeated
+    checks skip the resolver (a no-op for the numeric default hosts). Entries
+    expire with the TTL bucket, so a failed or stale resolution doesn't stick
+    for the process lifetime."""
+    return _resolve_cached(host, port, int(time.monotonic() / _RESOLVE_TTL))
+
+
 class InternetConnectivityChecker:
     """Class to check internet connectivity using multiple methods."""
 
@@ -59,6 +78,30 @@ class InternetConnectivityChecker:
         self.retry_count = self.config["retry_count"]
         self.retry_delay = self.config["retry_delay"]
         self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def _with_retries(self, func, *args):
+        """
+        Run a check callable with jittered exponential-backoff retries.
+
+        Jitter de-correlates retries from other clients hammering the same
+        endpoints, avoiding the synchronized bursts a constant delay produces.
+
+        Args:
+            func: Callable performing one check attempt (raises on failure)
+            *args: Arguments passed through to the callable
+        """
+        retrying = backoff.on_exception(
+            backoff.expo,
+            (socket.error, socket.gaierror, requests.exceptions.RequestException),
+            max_tries=self.retry_count + 1,
+            factor=self.retry_delay,
+            max_value=10,
+            jitter=backoff.full_jitter
+        )(func)
+        return retrying(*args)
 
     def _check_socket_connection(self, host: str) -> Tuple[str, bool, str]:
         """
@@ -70,19 +113,26 @@ class InternetConnectivityChecker:
         Returns:
             Tuple of (host, success status, error message if any)
         """
-        for attempt in range(self.retry_count + 1):
-            try:
-                socket.create_connection(
-                    (host, self.config["socket_port"]),
-                    timeout=self.timeout
-                )
-                return host, True, ""
-            except (socket.timeout, socket.error) as e:
-                error_msg = str(e)
-                if attempt < self.retry_count:
-                    time.sleep(self.retry_delay)
-                    continue
-                return host, False, error_msg
+        def connect():
+            # Try every resolved address like socket.create_connection does:
+            # the first addrinfo entry may be an unroutable family (e.g. IPv6
+            # on an IPv4-only network) while a later one still connects
+            last_error = None
+            for family, socktype, proto, _, sockaddr in _resolve(host, self.config["socket_port"]):
+                try:
+                    with socket.socket(family, socktype, proto) as sock:
+                        sock.settimeout(self.timeout)
+                        sock.connect(sockaddr)
+                    return
+                except OSError as e:
+                    last_error = e
+            raise last_error if last_error else OSError(f"getaddrinfo returned no addresses for {host}")
+
+        try:
+            self._with_retries(connect)
+            return host, True, ""
+        except (socket.timeout, socket.error) as e:
+            return host, False, str(e)
 
     def _check_dns_resolution(self, hostname: str) -> Tuple[str, bool, str]:
         """
@@ -94,16 +144,11 @@ class InternetConnectivityChecker:
         Returns:
             Tuple of (hostname, success status, error message if any)
         """
-        for attempt in range(self.retry_count + 1):
-            try:
-                socket.gethostbyname(hostname)
-                return hostname, True, ""
-            except socket.gaierror as e:
-                error_msg = str(e)
-                if attempt < self.retry_count:
-                    time.sleep(self.retry_delay)
-                    continue
-                return hostname, False, error_msg
+        try:
+            self._with_retries(socket.gethostbyname, hostname)
+            return hostname, True, ""
+        except socket.gaierror as e:
+            return hostname, False, str(e)
 
     def _check_http_connection(self, url: str) -> Tuple[str, bool, str]:
         """
@@ -115,39 +160,83 @@ class InternetConnectivityChecker:
         Returns:
             Tuple of (url, success status, error message if any)
         """
-        for attempt in range(self.retry_count + 1):
-            try:
-                response = self.session.head(url, timeout=self.timeout)
-                response.raise_for_status()
-                return url, True, ""
-            except requests.exceptions.RequestException as e:
-                error_msg = str(e)
-                if attempt < self.retry_count:
-                    time.sleep(self.retry_delay)
-                    continue
-                return url, False, error_msg
-
-    def _check_urllib_connection(self) -> Tuple[bool, str]:
+        def probe():
+            # GET with stream=True: some CDNs reject HEAD, and streaming
+            # avoids pulling the body for a liveness probe
+            response = self.session.get(url, timeout=self.timeout,
+                                        stream=True, allow_redirects=False)
+            response.raise_for_status()
+            response.close()
+
+        try:
+            self._with_retries(probe)
+            return url, True, ""
+        except requests.exceptions.RequestException as e:
+            return url, False, str(e)
+
+    async def _check_socket_async(self, host: str) -> Tuple[str, str, bool, str]:
         """
-        Check connectivity using urllib as a fallback.
+        Check connectivity by opening a connection to a reliable host.
+
+        Args:
+            host: Host to connect to
 
         Returns:
-            Tuple of (success status, error message if any)
+            Tuple of (check type, host, success status, error message if any)
+        """
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, self.config["socket_port"]),
+                timeout=self.timeout
+            )
+            writer.close()
+            return "socket", host, True, ""
+        except Exception as e:
+            return "socket", host, False, str(e)
+
+    async def _check_dns_async(self, hostname: str) -> Tuple[str, str, bool, str]:
         """
-        for attempt in range(self.retry_count + 1):
-            try:
-                urllib.request.urlopen("https://www.google.com", timeout=self.timeout)
-                return True, ""
-            except urllib.error.URLError as e:
-                error_msg = str(e)
-                if attempt < self.retry_count:
-                    time.sleep(self.retry_delay)
-                    continue
-                return False, error_msg
+        Check if DNS resolution works for a hostname.
 
-    def is_connected(self, verbose: bool = False) -> bool:
+        Args:
+            hostname: Hostname to resolve
+
+        Returns:
+            Tuple of (check type, hostname, success status, error message if any)
         """
-        Check if the device has internet connectivity using multiple methods.
+        try:
+            loop = asyncio.get_running_loop()
+            await asyncio.wait_for(
+                loop.getaddrinfo(hostname, None),
+                timeout=self.timeout
+            )
+            return "dns", hostname, True, ""
+        except Exception as e:
+            return "dns", hostname, False, str(e)
+
+    async def _check_http_async(self, url: str) -> Tuple[str, str, bool, str]:
+        """
+        Check connectivity by making an HTTP request.
+
+        Args:
+            url: URL to request
+
+        Returns:
+            Tuple of (check type, url, success status, error message if any)
+        """
+        try:
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.head(url, allow_redirects=False) as response:
+                    response.raise_for_status()
+            return "http", url, True, ""
+        except Exception as e:
+            return "http", url, False, str(e)
+
+    async def _is_connected_async(self, verbose: bool = False) -> bool:
+        """
+        Race all connectivity probes concurrently; the first success wins and
+        cancels the rest.
 
         Args:
             verbose: If True, log detailed results of each check
@@ -155,62 +244,55 @@ class InternetConnectivityChecker:
         Returns:
             Boolean indicating if connectivity is available
         """
-        checks = []
         results = {"socket": [], "dns": [], "http": []}
 
-        # Parallel check of socket connections
-        with ThreadPoolExecutor(max_workers=min(4, len(self.config["reliable_hosts"]))) as executor:
-            futures = [executor.submit(self._check_socket_connection, host)
-                       for host in self.config["reliable_hosts"]]
-
-            for future in as_completed(futures):
-                host, success, error = future.result()
-                results["socket"].append((host, success, error))
+        tasks = [
+            *[asyncio.ensure_future(self._check_socket_async(host))
+              for host in self.config["reliable_hosts"]],
+            *[asyncio.ensure_future(self._check_dns_async(host))
+              for host in self.config["dns_hosts"]],
+            *[asyncio.ensure_future(self._check_http_async(url))
+              for url in self.config["http_endpoints"]],
+        ]
+
+        connected = False
+        try:
+            for future in asyncio.as_completed(tasks):
+                check_type, target, success, error = await future
+                results[check_type].append((target, success, error))
                 if success:
-                    checks.append(True)
+                    connected = True
+                    break
                 elif verbose:
-                    logger.debug(f"Socket connection to {host} failed: {error}")
-
-        # If socket connections all failed, try DNS resolution
-        if not any(checks):
-            with ThreadPoolExecutor(max_workers=min(4, len(self.config["dns_hosts"]))) as executor:
-                futures = [executor.submit(self._check_dns_resolution, host)
-                           for host in self.config["dns_hosts"]]
-
-                for future in as_completed(futures):
-                    host, success, error = future.result()
-                    results["dns"].append((host, success, error))
-                    if success:
-                        checks.append(True)
-                    elif verbose:
-                        logger.debug(f"DNS resolution for {host} failed: {error}")
-
-        # If still no connections, try HTTP
-        if not any(checks):
-            with ThreadPoolExecutor(max_workers=min(4, len(self.config["http_endpoints"]))) as executor:
-                futures = [executor.submit(self._check_http_connection, url)
-                           for url in self.config["http_endpoints"]]
-
-                for future in as_completed(futures):
-                    url, success, error = future.result()
-                    results["http"].append((url, success, error))
-                    if success:
-                        checks.append(True)
-                    elif verbose:
-                        logger.debug(f"HTTP connection to {url} failed: {error}")
-
-        # Last resort, try urllib
-        if not any(checks):
-            success, error = self._check_urllib_connection()
-            if success:
-                checks.append(True)
-            elif verbose:
-                logger.debug(f"Urllib connection failed: {error}")
+                    logger.debug(f"{check_type} check for {target} failed: {error}")
+        finally:
+            for task in tasks:
+                task.cancel()
 
         if verbose:
             self._print_results(results)
 
-        return any(checks)
+        return connected
+
+    def is_connected(self, verbose: bool = False) -> bool:
+        """
+        Check if the device has internet connectivity using multiple methods.
+
+        Args:
+            verbose: If True, log detailed results of each check
+
+        Returns:
+            Boolean indicating if connectivity is available
+        """
+        # asyncio.run raises RuntimeError when a loop is already running in
+        # this thread, so dispatch to the package's background loop instead.
+        # The import is lazy so the module keeps working as a standalone
+        # script (see __main__ below), where asyncio.run is fine.
+        try:
+            from ..processors import run_async
+        except ImportError:
+            return asyncio.run(self._is_connected_async(verbose))
+        return run_async(self._is_connected_async(verbose))
 
     def _print_results(self, results: Dict) -> None:
         """
@@ -254,6 +336,7 @@ class InternetConnectivityChecker:
             })
             if success:
                 results["connected"] = True
+                break
 
         # Check DNS resolutions if needed
         if not results["connected"]:
@@ -266,6 +349,7 @@ class InternetConnectivityChecker:
                 })
                 if success:
                     results["connected"] = True
+                    break
 
         # Check HTTP connections if needed
         if not results["connected"]:
@@ -278,6 +362,7 @@ class InternetConnectivityChecker:
                 })
                 if success:
                     results["connected"] = True
+                    break
 
         return results
 
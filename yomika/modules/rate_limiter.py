@@ -1,39 +1,195 @@
 import time
+import random
 import asyncio
+import threading
 
-from ..defaults import Defaults
+from ..defaults import DEFAULT_RPS_LIMIT, RATE_LIMIT_STATUS_CODES
 
 class RequestRateLimiter:
-    """Simple rate limiter for web requests."""
+    """Token-bucket rate limiter for web requests.
 
-    def __init__(self, requests_per_second: float = Defaults.DEFAULT_RPS_LIMIT):
+    Bursts of up to ``capacity`` requests proceed immediately when the budget
+    has been underused; only sustained exceedance of the refill rate blocks.
+    Buckets are kept per host (the optional ``host`` argument to wait), so a
+    throttled host cannot slow down requests to unrelated hosts.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_RPS_LIMIT,
+                 capacity: float = None):
         """
         Initialize rate limiter.
 
         Args:
-            requests_per_second: Maximum number of requests per second
+            requests_per_second: Sustained maximum number of requests per second
+                (the bucket refill rate)
+            capacity: Maximum burst size in requests; defaults to one second's
+                worth of budget
         """
-        self.min_interval = 1.0 / requests_per_second
-        self.last_request_time = 0
+        self.refill_rate = requests_per_second
+        self.capacity = capacity if capacity is not None else max(1.0, requests_per_second)
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
 
-    def wait(self):
-        """Wait if necessary to respect the rate limit."""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
+    def _reserve(self, host=None) -> float:
+        """Take a token from the host's bucket, returning the time to sleep (0 if none)."""
+        now = time.monotonic()
+        tokens, last_refill = self._buckets.get(host) or (self.capacity, now)
+        tokens = min(self.capacity, tokens + (now - last_refill) * self.refill_rate)
+        if tokens >= 1:
+            self._buckets[host] = (tokens - 1, now)
+            return 0.0
+        sleep_time = (1 - tokens) / self.refill_rate
+        self._buckets[host] = (tokens - 1, now)
+        return sleep_time
 
-        if time_since_last_request < self.min_interval:
-            sleep_time = self.min_interval - time_since_last_request
+    def wait(self, host: str = None):
+        """Wait if necessary to respect the rate limit."""
+        with self._lock:
+            sleep_time = self._reserve(host)
+        if sleep_time > 0:
             time.sleep(sleep_time)
 
-        self.last_request_time = time.time()
-
-    async def wait_async(self):
+    async def wait_async(self, host: str = None):
         """Wait if necessary to respect the rate limit"""
-        current_time = time.time()
-        elapsed_since_last = current_time - self.last_request_time
-
-        if elapsed_since_last < self.min_interval:
-            sleep_time = self.min_interval - elapsed_since_last
+        async with self._async_lock:
+            with self._lock:
+                sleep_time = self._reserve(host)
+        if sleep_time > 0:
             await asyncio.sleep(sleep_time)
 
-        self.last_request_time = time.time()
\ No newline at end of file
+
+class AdaptiveRateLimiter(RequestRateLimiter):
+    """Token-bucket rate limiter that adapts its rate to server feedback.
+
+    Classic AIMD: the refill rate is halved whenever ``observe`` sees a 429 or
+    503 (honouring a numeric Retry-After as a hard hold), and additively
+    restored towards its initial value after a streak of successes. Sleeps are
+    jittered so concurrent clients backing off together don't re-synchronize
+    and hammer the server in lockstep. Drop-in compatible with
+    RequestRateLimiter; the scrapers feed it statuses automatically when it is
+    set as ``config.rate_limiter``.
+    """
+
+    def __init__(self, requests_per_second: float = DEFAULT_RPS_LIMIT,
+                 capacity: float = None, min_rate: float = 0.5,
+                 increase_step: float = 1.0, increase_after: int = 10):
+        """
+        Initialize rate limiter.
+
+        Args:
+            requests_per_second: Initial (and maximum) bucket refill rate
+            capacity: Maximum burst size in requests; defaults to one second's
+                worth of budget
+            min_rate: Floor the rate never drops below, in requests per second
+            increase_step: Requests per second added back per successful streak
+            increase_after: Consecutive 2xx responses needed before increasing
+        """
+        super().__init__(requests_per_second, capacity)
+        self._initial_rate = self.refill_rate
+        self.min_rate = min_rate
+        self.increase_step = increase_step
+        self.increase_after = increase_after
+        self._success_streak = 0
+        self._hold_until = 0.0
+
+    def _reserve(self, host=None) -> float:
+        sleep_time = super()._reserve(host)
+        now = time.monotonic()
+        if self._hold_until > now:
+            sleep_time = max(sleep_time, self._hold_until - now)
+        if sleep_time > 0:
+            sleep_time += random.uniform(0, sleep_time * 0.5)
+        return sleep_time
+
+    def observe(self, status: int, retry_after=None):
+        """Adapt the rate to a response: halve on 429/503, slowly restore on 2xx.
+
+        Args:
+            status: HTTP status code of the response
+            retry_after: Optional Retry-After header value; numeric seconds
+                are honoured as a hold before the next request
+        """
+        with self._lock:
+            if status in RATE_LIMIT_STATUS_CODES:
+                self._success_streak = 0
+                self.refill_rate = max(self.min_rate, self.refill_rate / 2)
+                try:
+                    delay = float(retry_after)
+                except (TypeError, ValueError):
+                    delay = 0.0
+                if delay > 0:
+                    self._hold_until = time.monotonic() + delay
+            elif 200 <= status < 300:
+                self._success_streak += 1
+                if self._success_streak >= self.increase_after:
+                    self._success_streak = 0
+                    self.refill_rate = min(self._initial_rate,
+                                           self.refill_rate + self.increase_step)
+
+
+class SlidingWindowRateLimiter:
+    """Sliding-window-counter rate limiter for web requests.
+
+    Caps throughput over a trailing window by weighting the previous window's
+    count by the unelapsed fraction of the current one — cheaper than keeping a
+    log of timestamps, without the boundary bursts of fixed windows. Drop-in
+    compatible with RequestRateLimiter via wait()/wait_async().
+    """
+
+    def __init__(self, limit: float = DEFAULT_RPS_LIMIT,
+                 window_size: float = 1.0):
+        """
+        Initialize rate limiter.
+
+        Args:
+            limit: Maximum number of requests per window
+            window_size: Window length in seconds
+        """
+        self.limit = limit
+        self.window_size = window_size
+        self.prev_count = 0
+        self.curr_count = 0
+        self.curr_window_start = time.monotonic()
+        self._lock = threading.Lock()
+        self._async_lock = asyncio.Lock()
+
+    def _reserve(self) -> float:
+        """Record a request, returning the time to sleep before proceeding (0 if none)."""
+        now = time.monotonic()
+        elapsed = (now - self.curr_window_start) / self.window_size
+
+        # Rotate windows if the current one has ended
+        if elapsed >= 1:
+            windows_passed = int(elapsed)
+            self.prev_count = self.curr_count if windows_passed == 1 else 0
+            self.curr_count = 0
+            self.curr_window_start += self.window_size * windows_passed
+            elapsed = (now - self.curr_window_start) / self.window_size
+
+        estimated = self.prev_count * (1 - elapsed) + self.curr_count
+        if estimated < self.limit:
+            self.curr_count += 1
+            return 0.0
+        return self.window_size * (1 - elapsed)
+
+    def wait(self, host: str = None):
+        """Wait if necessary to respect the rate limit. The host argument is
+        accepted for interchangeability with RequestRateLimiter; the window is
+        shared across hosts."""
+        while True:
+            with self._lock:
+                sleep_time = self._reserve()
+            if sleep_time <= 0:
+                return
+            time.sleep(sleep_time)
+
+    async def wait_async(self, host: str = None):
+        """Wait if necessary to respect the rate limit"""
+        while True:
+            async with self._async_lock:
+                with self._lock:
+                    sleep_time = self._reserve()
+            if sleep_time <= 0:
+                return
+            await asyncio.sleep(sleep_time)
@@ -1,8 +1,18 @@
+import functools
+import ipaddress
 import logging
 import re
 from urllib.parse import urlparse
 from typing import Union, Dict, Optional, Literal, LiteralString
 
+# Prefer google/re2 when available: its linear-time DFA matching avoids
+# backtracking blow-ups on non-matching hosts. Falls back to the stdlib
+# engine transparently.
+try:
+    import re2 as _regex_engine
+except ImportError:
+    _regex_engine = re
+
 
 class URLValidator:
     """
@@ -18,28 +28,10 @@ class URLValidator:
 
     # Regular expression for domain validation
     # Follows RFC 1034/1035 with some practical limitations
-    DOMAIN_PATTERN = re.compile(
+    DOMAIN_PATTERN = _regex_engine.compile(
         r'^(?:[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?\.)+[a-zA-Z0-9][a-zA-Z0-9-]{0,61}[a-zA-Z0-9]$'
     )
 
-    # Regular expression for IP address validation (IPv4)
-    IPV4_PATTERN = re.compile(
-        r'^(?:(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)\.){3}(?:25[0-5]|2[0-4][0-9]|[01]?[0-9][0-9]?)$'
-    )
-
-    # Regular expression for IPv6 validation (simplified)
-    IPV6_PATTERN = re.compile(
-        r'^(?:[0-9a-fA-F]{1,4}:){7}[0-9a-fA-F]{1,4}$|'
-        r'^::(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}$|'
-        r'^[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}$|'
-        r'^[0-9a-fA-F]{1,4}:[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}$|'
-        r'^(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}$|'
-        r'^(?:[0-9a-fA-F]{1,4}:){0,3}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:){0,2}[0-9a-fA-F]{1,4}$|'
-        r'^(?:[0-9a-fA-F]{1,4}:){0,4}[0-9a-fA-F]{1,4}::(?:[0-9a-fA-F]{1,4}:)?[0-9a-fA-F]{1,4}$|'
-        r'^(?:[0-9a-fA-F]{1,4}:){0,5}[0-9a-fA-F]{1,4}::[0-9a-fA-F]{1,4}$|'
-        r'^(?:[0-9a-fA-F]{1,4}:){0,6}[0-9a-fA-F]{1,4}::$'
-    )
-
     def __init__(self,
                  allowed_schemes: list = None,
                  require_tld: bool = True,
@@ -107,9 +99,16 @@ class URLValidator:
             if not parsed_url.netloc:
                 return {"error": "URL must include a domain/host"}
 
-            # Handle IP addresses
-            is_ipv4 = self.IPV4_PATTERN.match(parsed_url.hostname)
-            is_ipv6 = self.IPV6_PATTERN.match(parsed_url.hostname) if parsed_url.hostname else False
+            # Handle IP addresses via the C-implemented ipaddress parser —
+            # far cheaper than regex classification, especially for IPv6
+            is_ipv4 = is_ipv6 = False
+            if parsed_url.hostname:
+                try:
+                    ip = ipaddress.ip_address(parsed_url.hostname)
+                    is_ipv4 = isinstance(ip, ipaddress.IPv4Address)
+                    is_ipv6 = isinstance(ip, ipaddress.IPv6Address)
+                except ValueError:
+                    pass
 
             if is_ipv4 and not self.allow_ip:
                 return {"error": "IP addresses are not allowed as hosts"}
@@ -156,28 +155,19 @@ class URLValidator:
         return bool(self.DOMAIN_PATTERN.match(domain))
 
 
-def is_valid_url(url: str,
-                 allowed_schemes: list = None,
-                 strict: bool = False,
-                 validator: Literal['urllib', 'self'] = 'urllib') -> bool:
-    """
-    A simple function to validate URLs with common settings.
-
-    Args:
-        url: The URL string to validate
-        allowed_schemes: List of allowed URL schemes (default: ['http', 'https'])
-        strict: If True, applies stricter validation rules
-
-    Returns:
-        bool: True if the URL is valid, False otherwise
-    """
+@functools.lru_cache(maxsize=4096)
+def _is_valid_url_cached(url: str,
+                         allowed_schemes: Optional[tuple],
+                         strict: bool,
+                         validator: str) -> bool:
+    """Memoized implementation behind is_valid_url; arguments must be hashable."""
     if allowed_schemes is None:
-        allowed_schemes = ['http', 'https']
+        allowed_schemes = ('http', 'https')
 
     if validator == 'self':
 
         validator = URLValidator(
-            allowed_schemes=allowed_schemes,
+            allowed_schemes=list(allowed_schemes),
             require_tld=strict,
             require_query=False,
             allow_ip=not strict,
@@ -192,6 +182,21 @@ def is_valid_url(url: str,
         return result is True
 
     else:
+        # Fast path for the common lowercase schemes: a couple of string ops
+        # instead of urlparse's ParseResult allocation and repeated splits
+        if url.startswith('https://'):
+            host = url[8:]
+        elif url.startswith('http://'):
+            host = url[7:]
+        else:
+            host = None
+
+        if host is not None:
+            separator_index = host.find('/')
+            if separator_index >= 0:
+                host = host[:separator_index]
+            return bool(host)
+
         try:
             result = urlparse(url)
             return all([result.scheme in ('http', 'https'), result.netloc])
@@ -200,6 +205,33 @@ def is_valid_url(url: str,
             return False
 
 
+def is_valid_url(url: str,
+                 allowed_schemes: list = None,
+                 strict: bool = False,
+                 validator: Literal['urllib', 'self'] = 'urllib') -> bool:
+    """
+    A simple function to validate URLs with common settings.
+
+    Results are memoized (lru_cache, 4096 entries), so re-validating duplicate
+    URLs across a batch is a dict lookup. Use is_valid_url.cache_clear() to
+    reset between tests.
+
+    Args:
+        url: The URL string to validate
+        allowed_schemes: List of allowed URL schemes (default: ['http', 'https'])
+        strict: If True, applies stricter validation rules
+
+    Returns:
+        bool: True if the URL is valid, False otherwise
+    """
+    if allowed_schemes is not None:
+        allowed_schemes = tuple(allowed_schemes)
+    return _is_valid_url_cached(url, allowed_schemes, strict, validator)
+
+
+is_valid_url.cache_clear = _is_valid_url_cached.cache_clear
+
+
 if __name__ == "__main__":
     print(is_valid_url("https://www.example.com"))  # True
     print(is_valid_url("invalid-url"))  # False
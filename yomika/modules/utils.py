@@ -1,4 +1,65 @@
+import random
 import logging
+from typing import Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+def parse_retry_after(value) -> Optional[float]:
+    """Parse a Retry-After header into seconds.
+
+    Accepts both forms the header allows: a delay in seconds and an HTTP-date.
+    Returns None when the header is missing or unparseable.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_date is None:
+        return None
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_date - datetime.now(timezone.utc)).total_seconds())
+
+def retry_after_wait(exception) -> float:
+    """Wait value for backoff.runtime when a request was rate limited.
+
+    Uses the server-provided Retry-After when the exception carries one,
+    otherwise a short jittered delay to de-correlate concurrent retries.
+    """
+    retry_after = getattr(exception, 'retry_after', None)
+    if retry_after:
+        return retry_after
+    return random.uniform(0.5, 2.0)
+
+def content_type_matches(expected: str, content_type: str) -> bool:
+    """Compare an expected content type against the header's mime token.
+
+    Strips parameters such as charset before comparing, so 'text/html'
+    matches 'text/html; charset=utf-8' but not 'text/html+xml'. A bare
+    type like 'text' matches any subtype of it.
+    """
+    mime = content_type.split(';', 1)[0].strip().lower()
+    expected = expected.strip().lower()
+    return mime == expected or ('/' not in expected and mime.split('/', 1)[0] == expected)
+
+def safe_callback(callback, result, name: str):
+    """Invoke an optional user callback, logging instead of propagating errors.
+
+    Defined once at module level so the scrapers don't build a closure per
+    request just to guard a callback that is usually None.
+    """
+    if not callback:
+        return
+    try:
+        callback(result)
+    except Exception:
+        logging.exception('An exception was encountered while running the %s callback', name)
 
 def backoff_handler_generic(details):
     """Log backoff retry attempts."""
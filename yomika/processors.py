@@ -1,13 +1,65 @@
 import asyncio
-import inspect
 import concurrent.futures
-from typing import Coroutine, Callable
+import threading
+from typing import Coroutine, Callable, Iterator, Optional
 
 import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
 
 from .classes import ScrapedResponse, WebscrapeConfig
+from .defaults import DEFAULT_MAX_CONCURRENCY
 from .webscrape_requests import webscrape_requests
-from .webscrape_aiohttp import webscrape_aiohttp
+from .webscrape_aiohttp import webscrape_aiohttp, _get_session, _close_sessions
+from .webscrape_httpx import webscrape_httpx, _close_clients
+
+# Single long-lived background event loop shared by all run_async calls, so the
+# per-loop session registry above actually survives between batches.
+_bg_loop: Optional[asyncio.AbstractEventLoop] = None
+_bg_loop_lock = threading.Lock()
+
+
+def _get_bg_loop() -> asyncio.AbstractEventLoop:
+    """Return the background event loop, starting its daemon thread on first use."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            _bg_loop = asyncio.new_event_loop()
+            threading.Thread(target=_bg_loop.run_forever, daemon=True).start()
+    return _bg_loop
+
+
+def use_uvloop() -> bool:
+    """Install uvloop as the process-wide event loop policy, if available.
+
+    uvloop's libuv-backed loop dispatches socket readiness with far fewer
+    Python-level callbacks than the default selector loop, roughly doubling
+    throughput for I/O-bound scraping. Opt-in rather than automatic because
+    the policy affects every event loop created afterwards in the process;
+    call it before the first scrape (and before creating any loop of your
+    own). Returns True if uvloop was installed, False if it isn't available.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    uvloop.install()
+    return True
+
+
+def shutdown():
+    """Stop the background event loop after closing any sessions or clients it owns."""
+    global _bg_loop
+    with _bg_loop_lock:
+        if _bg_loop is None or _bg_loop.is_closed():
+            return
+        # Close both registries while the loop still runs; leaving the httpx
+        # clients to their atexit hook would schedule aclose() behind the
+        # queued stop and hang until its timeout
+        _close_sessions()
+        _close_clients()
+        _bg_loop.call_soon_threadsafe(_bg_loop.stop)
+        _bg_loop = None
 
 
 def run_async(coro: Coroutine):
@@ -20,44 +72,134 @@ def run_async(coro: Coroutine):
         The result of the coroutine execution
     """
     # Type checking
-    if not inspect.iscoroutine(coro) and not inspect.isawaitable(coro):
+    if not asyncio.iscoroutine(coro) and not hasattr(coro, '__await__'):
         raise TypeError(f"Expected a coroutine or awaitable, got {type(coro).__name__}")
 
-    # Always use a separate thread with its own event loop
+    # Submit to the persistent background loop in its own thread
     # This is the safest approach for a module
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(lambda: asyncio.run(coro))
-        return future.result()
+    return asyncio.run_coroutine_threadsafe(coro, _get_bg_loop()).result()
+
 
+def scrape_url_list_sync(
+        url_list: list[str],
+        config: Optional[WebscrapeConfig] = None,
+        session: Optional[requests.Session] = None
+) -> list[ScrapedResponse]:
+    """Scrape a URL list over a thread pool sharing one pooled requests Session.
 
-def scrape_url_list_sync(url_list: list[str]) -> list[ScrapedResponse]:
-    return [webscrape_requests(url) for url in url_list]
+    Threads overlap the network waits (requests releases the GIL during socket
+    I/O) and the shared session reuses TCP/TLS connections across URLs.
+    """
+    if not url_list:
+        return []
+
+    should_close_session = session is None
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(url_list))) as executor:
+            return list(executor.map(
+                lambda url: webscrape_requests(url, config=config, session=session),
+                url_list
+            ))
+    finally:
+        if should_close_session:
+            session.close()
 
 
 def scrape_url_list_async(
         url_list: list[str],
-        config: WebscrapeConfig = WebscrapeConfig,
+        config: Optional[WebscrapeConfig] = None,
         on_success: Callable = None,
-        on_failure: Callable = None
+        on_failure: Callable = None,
+        session: Optional[aiohttp.ClientSession] = None
 ) -> list[ScrapedResponse]:
     async def process_async_scrape():
 
-        async with aiohttp.ClientSession() as session:
+        semaphore = asyncio.Semaphore(_max_concurrency(config))
 
-            tasks = [webscrape_aiohttp(
-                url=url,
-                session=session,
-                config=config,
-                on_success=on_success,
-                on_failure=on_failure
-            ) for url in url_list]
+        async def bounded_scrape(url):
+            async with semaphore:
+                return await _scrape_one(url, config, session, on_success, on_failure)
 
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Deduplicate before dispatch: repeated URLs share one request, and
+        # results are re-expanded to input order (duplicates reference the
+        # same ScrapedResponse object)
+        unique_urls: dict[str, int] = {}
+        order = [unique_urls.setdefault(url, len(unique_urls)) for url in url_list]
 
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    raise result
+        # Fail fast: TaskGroup cancels the remaining tasks on the first
+        # exception (gather would let them run on in the background loop);
+        # the first failure is re-raised bare to keep the caller-facing
+        # exception types unchanged
+        try:
+            async with asyncio.TaskGroup() as task_group:
+                tasks = [task_group.create_task(bounded_scrape(url)) for url in unique_urls]
+        except ExceptionGroup as eg:
+            raise eg.exceptions[0]
 
-            return results
+        results = [task.result() for task in tasks]
+        return [results[i] for i in order]
 
     return run_async(process_async_scrape())
+
+
+def scrape_url_stream_async(
+        url_list: list[str],
+        config: Optional[WebscrapeConfig] = None,
+        on_success: Callable = None,
+        on_failure: Callable = None,
+        session: Optional[aiohttp.ClientSession] = None
+) -> Iterator[ScrapedResponse]:
+    """Scrape a URL list concurrently, yielding each result as it completes.
+
+    Unlike scrape_url_list_async, results arrive in completion order and can be
+    consumed while the rest of the batch is still in flight.
+    """
+    semaphore = asyncio.Semaphore(_max_concurrency(config))
+
+    async def bounded_scrape(url):
+        async with semaphore:
+            return await _scrape_one(url, config, session, on_success, on_failure)
+
+    loop = _get_bg_loop()
+    futures = [asyncio.run_coroutine_threadsafe(bounded_scrape(url), loop) for url in url_list]
+
+    try:
+        for future in concurrent.futures.as_completed(futures):
+            yield future.result()
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+def _max_concurrency(config: Optional[WebscrapeConfig]) -> int:
+    return config.max_concurrency if config is not None else DEFAULT_MAX_CONCURRENCY
+
+
+async def _scrape_one(
+        url: str,
+        config: Optional[WebscrapeConfig],
+        session: Optional[aiohttp.ClientSession],
+        on_success: Callable,
+        on_failure: Callable
+) -> ScrapedResponse:
+    """Scrape one URL with the backend selected by config (aiohttp by default)."""
+    if config is not None and config.backend == 'httpx':
+        return await webscrape_httpx(
+            url=url,
+            config=config,
+            on_success=on_success,
+            on_failure=on_failure
+        )
+    return await webscrape_aiohttp(
+        url=url,
+        session=session or _get_session(config.verify_ssl if config else True),
+        config=config,
+        on_success=on_success,
+        on_failure=on_failure
+    )
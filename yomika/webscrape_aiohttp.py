@@ -1,31 +1,143 @@
 import time
 from typing import Optional, Callable
 import logging
+from types import MappingProxyType
+from functools import lru_cache
+import ssl
 import asyncio
+import atexit
 
-import requests
 import backoff
 import aiohttp
 
-from .defaults import Defaults
+from .defaults import Defaults, DEFAULT_HTTP_HEADERS, RATE_LIMIT_STATUS_CODES
 from .modules.url_validator import is_valid_url
-from .modules.utils import backoff_handler_generic
+from .modules.utils import backoff_handler_generic, safe_callback, content_type_matches, parse_retry_after, retry_after_wait
 from .exceptions import WebPageLoadError, ContentTypeError, InvalidURLError, RateLimitExceededError
 from .classes import ScrapedResponse, WebscrapeConfig
 
+logger = logging.getLogger(__name__)
+
+# Shared config (and thus rate limiter) for callers that don't pass their own
+_DEFAULT_CONFIG = WebscrapeConfig()
+
+# One SSLContext for the whole module: building one per connection costs a
+# full CA-bundle load, and a shared context also lets TLS sessions resume
+_SSL_CONTEXT = ssl.create_default_context()
+
+# One ClientSession per (event loop, verify_ssl), created lazily and reused so
+# keep-alive connections, the DNS cache and TLS sessions survive between batches.
+_session_registry: dict[tuple, aiohttp.ClientSession] = {}
+
+
+def _dispose_stale(session: aiohttp.ClientSession):
+    """Dispose of a session whose event loop is already closed.
+
+    close() cannot be awaited on the dead loop, but its first step already
+    aborts the transports and marks the session closed, so drive it one step
+    and drop the rest instead of leaking the connector.
+    """
+    if session.closed:
+        return
+    close_coro = session.close()
+    try:
+        close_coro.send(None)
+    except StopIteration:
+        pass
+    close_coro.close()
+
+
+def _get_session(verify_ssl: bool = True) -> aiohttp.ClientSession:
+    """Return the shared ClientSession for the running event loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+
+    # Evict and dispose of sessions whose loop has been closed (e.g. after asyncio.run)
+    for stale_key in [k for k in _session_registry if k[0].is_closed()]:
+        _dispose_stale(_session_registry.pop(stale_key))
+
+    key = (loop, verify_ssl)
+    session = _session_registry.get(key)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=200,
+                limit_per_host=50,
+                ttl_dns_cache=300,
+                use_dns_cache=True,
+                enable_cleanup_closed=True,
+                keepalive_timeout=75,
+                ssl=_SSL_CONTEXT if verify_ssl else False
+            )
+        )
+        _session_registry[key] = session
+    return session
+
+
+@lru_cache(maxsize=16)
+def _client_timeout(total) -> aiohttp.ClientTimeout:
+    """Shared ClientTimeout per distinct total; configs rarely vary, so most
+    requests reuse one frozen object instead of allocating per call."""
+    return aiohttp.ClientTimeout(total=total)
+
+
+async def close_all_sessions():
+    """Close every cached session; sessions on other loops are closed threadsafe.
+
+    Callers driving their own short-lived loop (e.g. a bare asyncio.run)
+    should await this before the loop exits, so the per-loop session is
+    closed cleanly rather than evicted after its loop is gone.
+    """
+    running_loop = asyncio.get_running_loop()
+    for (loop, _), session in list(_session_registry.items()):
+        if session.closed or loop.is_closed():
+            continue
+        if loop is running_loop:
+            await session.close()
+        else:
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+    _session_registry.clear()
+
+
+def _close_sessions():
+    """Close all registered sessions on their owning loops. Registered via atexit."""
+    for (loop, _), session in list(_session_registry.items()):
+        if session.closed:
+            continue
+        try:
+            if loop.is_closed():
+                _dispose_stale(session)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(session.close(), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(session.close())
+        except Exception:
+            pass
+    _session_registry.clear()
+
+
+atexit.register(_close_sessions)
+
 
 @backoff.on_exception(
     backoff.expo,
     exception=(WebPageLoadError,
-        requests.RequestException,
-        RateLimitExceededError,
-        ConnectionError),
+        aiohttp.ClientError,
+        ConnectionError,
+        asyncio.TimeoutError),
+    max_tries=Defaults.DEFAULT_MAX_RETRIES,
+    max_time=Defaults.DEFAULT_MAX_TIME,
+    on_backoff=backoff_handler_generic)
+@backoff.on_exception(
+    backoff.runtime,
+    exception=RateLimitExceededError,
+    value=retry_after_wait,
+    jitter=None,
     max_tries=Defaults.DEFAULT_MAX_RETRIES,
     max_time=Defaults.DEFAULT_MAX_TIME,
     on_backoff=backoff_handler_generic)
 async def webscrape_aiohttp(
         url: str,
-        config: WebscrapeConfig = WebscrapeConfig,
+        config: Optional[WebscrapeConfig] = None,
         session: Optional[aiohttp.ClientSession] = None,
         on_success: Callable = None,
         on_failure: Callable = None
@@ -47,7 +159,7 @@ async def webscrape_aiohttp(
             # rate_limiter: Optional rate limiter object
         session: Optional aiohttp ClientSession for connection pooling
         on_success: Callback function that will be called when the scrape succeeds
-        on_failure: Callback function that will be called if the scrape fails
+        on_failure: Callback function that will be called with the exception if the scrape fails
 
     Returns:
         ScrapedResponse: Object containing the response and metadata
@@ -58,148 +170,168 @@ async def webscrape_aiohttp(
         ContentTypeError: If the content type doesn't match expected type
     """
 
-    start_time = time.time()
-    error_message = None
+    start_time = time.monotonic()
+
+    if config is None:
+        config = _DEFAULT_CONFIG
 
     # Validate URL
     if not is_valid_url(url):
         raise InvalidURLError(f"Invalid URL format: {url}")
 
-    # Apply rate limiting if configured
+    # Apply rate limiting if configured, per host so slow hosts don't throttle others
     if config.rate_limiter:
-        await config.rate_limiter.wait_async()
+        await config.rate_limiter.wait_async(url.split('/', 3)[2])
 
     # Set up headers
-    headers = config.custom_headers or Defaults.DEFAULT_HTTP_HEADERS
+    headers = config.custom_headers or DEFAULT_HTTP_HEADERS
+
+    # Replay a fresh cached response, or prepare a conditional GET for a stale one
+    cache_key = None
+    if config.cache:
+        cache_key = config.cache.make_key('GET', url, headers)
+        cached_response = config.cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        cached_etag = config.cache.get_etag(cache_key)
+        if cached_etag:
+            headers = dict(headers)
+            headers['If-None-Match'] = cached_etag
 
     # Set up timeout
-    timeout_obj = aiohttp.ClientTimeout(total=config.timeout)
-
-    # Create a flag to determine if we need to close the session
-    should_close_session = False
-
-    def run_on_failure():
-        if not on_failure:
-            return
-        try:
-            on_failure(scrape_result)
-        except Exception as e:
-            logging.exception(f'An exception was encountered while running the on_failure callback: {e}')
+    timeout_obj = _client_timeout(config.timeout)
 
     try:
-        # Use provided session or create a new one
+        # Use provided session or the shared per-loop one; SSL verification
+        # lives on the session's connector, not in per-request kwargs
         if session is None:
-            session = aiohttp.ClientSession(timeout=timeout_obj)
-            should_close_session = True
-
-        # Configure request settings
-        request_kwargs = {
-            'url': url,
-            'headers': headers,
-            'params': config.params,
-            'cookies': config.cookies,
-            'allow_redirects': config.allow_redirects,
-            'ssl': config.verify_ssl if config.verify_ssl else False
-        }
-
-        # Add proxy if specified
-        if config.proxy:
-            request_kwargs['proxy'] = config.proxy
-
-        async with session.get(**request_kwargs) as response:
+            session = _get_session(config.verify_ssl)
+
+        # Static settings come precomputed from the config; only the URL, the
+        # timeout object and a possible conditional-GET header vary per call
+        request_kwargs = config._aiohttp_request_kwargs()
+        if headers is not request_kwargs['headers']:
+            request_kwargs = {**request_kwargs, 'headers': headers}
+
+        async with session.get(url, timeout=timeout_obj, **request_kwargs) as response:
+            # Feed the status back to adaptive limiters so they can slow down on 429/503
+            observe = getattr(config.rate_limiter, 'observe', None)
+            if observe:
+                observe(response.status, response.headers.get('Retry-After'))
+
             # Check for common rate limiting status codes
-            if response.status in (429, 503):
-                raise RateLimitExceededError(f"Rate limit exceeded: {response.status}")
+            if response.status in RATE_LIMIT_STATUS_CODES:
+                raise RateLimitExceededError(
+                    f"Rate limit exceeded: {response.status}",
+                    retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                )
+
+            # Revalidated: the stored entry is still good, return the cached body
+            if response.status == 304 and cache_key is not None:
+                stale_response = config.cache.get_stale(cache_key)
+                if stale_response is not None:
+                    config.cache.refresh(cache_key, dict(response.headers))
+                    return stale_response
 
             # Raise for HTTP errors
             response.raise_for_status()
 
-            # Read the response content
-            content = await response.read()
-            text = await response.text()
-
-            # Check content type if expected type is provided
+            # Read the response content once; text is decoded lazily from it.
+            # Streaming reads in bounded chunks, yielding to the event loop
+            # between chunks and avoiding one giant contiguous read buffer.
+            if config.stream:
+                buffer = bytearray()
+                async for chunk in response.content.iter_chunked(config.chunk_size):
+                    buffer.extend(chunk)
+                content = bytes(buffer)
+            else:
+                content = await response.read()
+
+            # Check content type if expected type is provided; compare the mime
+            # token so parameters like charset can't cause spurious mismatches
             content_type = response.headers.get('Content-Type', '')
-            if config.expected_content_type and config.expected_content_type not in content_type:
+            if config.expected_content_type and not content_type_matches(config.expected_content_type, content_type):
                 raise ContentTypeError(
                     f"Expected content type '{config.expected_content_type}' but got '{content_type}'"
                 )
 
             # Calculate elapsed time
-            elapsed_time = time.time() - start_time
+            elapsed_time = time.monotonic() - start_time
 
             scrape_result = ScrapedResponse(
                 url=url,
                 status_code=response.status,
                 content=content,
-                text=text,
-                headers=dict(response.headers),
+                headers=MappingProxyType(dict(response.headers)) if config.snapshot_headers else response.headers,
                 elapsed_time=elapsed_time,
                 content_type=content_type,
-                success=True
+                success=True,
+                charset=response.charset
             )
 
-            # run the on success callaback,
-            try:
-                if on_success:
-                    on_success(scrape_result)
-            except Exception as e:
-                logging.exception(f'An exception was encountered while running the on_sucess callback: {e}')
+            if cache_key is not None:
+                config.cache.set(cache_key, scrape_result)
+
+            safe_callback(on_success, scrape_result, 'on_success')
 
             return scrape_result
 
-    except aiohttp.ClientConnectorError as e:
-        error_message = f"Connection error for {url}: {str(e)}"
-        logging.error(error_message)
-        run_on_failure()
-        raise WebPageLoadError(error_message)
-
-    except asyncio.TimeoutError as e:
-        error_message = f"Timeout error for {url}: {str(e)}"
-        logging.error(error_message)
-        run_on_failure()
-        raise WebPageLoadError(error_message)
-
-    except aiohttp.TooManyRedirects as e:
-        error_message = f"Too many redirects for {url}: {str(e)}"
-        logging.error(error_message)
-        run_on_failure()
-        raise WebPageLoadError(error_message)
-
-    except aiohttp.ClientResponseError as e:
-        error_message = f"HTTP error for {url}: {str(e)}"
-        logging.error(error_message)
-        run_on_failure()
-        raise WebPageLoadError(error_message)
+    # One consolidated handler for the client library's failure modes; message
+    # formatting is gated so disabled logging costs nothing on the retry path,
+    # and 'from e' chains the original exception instead of discarding it
+    except (aiohttp.ClientConnectorError,
+            asyncio.TimeoutError,
+            aiohttp.TooManyRedirects,
+            aiohttp.ClientResponseError) as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to load %s: %s", url, e)
+        safe_callback(on_failure, e, 'on_failure')
+        raise WebPageLoadError(str(e)) from e
 
     except ContentTypeError as e:
-        error_message = str(e)
-        logging.error(error_message)
-        run_on_failure()
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(str(e))
+        safe_callback(on_failure, e, 'on_failure')
+        raise
+
+    # Let the retry decorator see the rate-limit error (and its retry_after)
+    except RateLimitExceededError:
         raise
 
     except Exception as e:
-        error_message = f"Unexpected error while loading {url}: {str(e)}"
-        logging.error(error_message)
-        run_on_failure()
-        raise WebPageLoadError(error_message)
-
-    finally:
-        # Close the session if we created it
-        if should_close_session and session is not None:
-            await session.close()
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Unexpected error while loading %s: %s", url, e)
+        safe_callback(on_failure, e, 'on_failure')
+        raise WebPageLoadError(str(e)) from e
+
+
+async def webscrape_aiohttp_many(
+        urls: list[str],
+        config: Optional[WebscrapeConfig] = None,
+        concurrency: int = 32
+) -> list:
+    """
+    Concurrently fetch a list of URLs over the shared per-loop ClientSession.
 
-    # This code shouldn't be reached
-    return ScrapedResponse(
-        url=url,
-        status_code=0,
-        content=b'',
-        text='',
-        headers={},
-        elapsed_time=time.time() - start_time,
-        content_type='',
-        success=False,
-        error=error_message
-    )
+    A semaphore bounds in-flight requests at `concurrency`; the session (and
+    thus its connection pool and DNS cache) comes from the module-level
+    registry, so batches reuse warm connections. Results are returned in input
+    order; failures come back as the raised exception object rather than
+    aborting the whole batch (asyncio.gather with return_exceptions=True).
+
+    Args:
+        urls: URLs to scrape
+        config: Webscraper Configuration of Class WebscrapeConfig
+        concurrency: Maximum number of requests in flight at once
+
+    Returns:
+        list: ScrapedResponse per URL, or the exception that scrape raised
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    session = _get_session(config.verify_ssl if config else True)
 
+    async def scrape_one(url: str):
+        async with semaphore:
+            return await webscrape_aiohttp(url, config, session=session)
 
+    return await asyncio.gather(*(scrape_one(url) for url in urls), return_exceptions=True)
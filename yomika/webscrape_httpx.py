@@ -0,0 +1,241 @@
+import time
+from typing import Optional, Callable
+import logging
+from types import MappingProxyType
+import asyncio
+import atexit
+
+import backoff
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from .defaults import Defaults, DEFAULT_HTTP_HEADERS, RATE_LIMIT_STATUS_CODES
+from .modules.url_validator import is_valid_url
+from .modules.utils import backoff_handler_generic, safe_callback, content_type_matches, parse_retry_after, retry_after_wait
+from .exceptions import WebPageLoadError, ContentTypeError, InvalidURLError, RateLimitExceededError
+from .classes import ScrapedResponse, WebscrapeConfig
+
+logger = logging.getLogger(__name__)
+
+# Shared config (and thus rate limiter) for callers that don't pass their own
+_DEFAULT_CONFIG = WebscrapeConfig()
+
+# One AsyncClient per (event loop, verify_ssl, proxy) — verify/proxy are
+# client-level settings in httpx, unlike aiohttp's per-request ssl/proxy
+_client_registry: dict = {}
+
+
+def _get_client(config: WebscrapeConfig) -> "httpx.AsyncClient":
+    """Return the shared HTTP/2 client for the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+
+    for stale_key in [k for k in _client_registry if k[0].is_closed()]:
+        del _client_registry[stale_key]
+
+    key = (loop, config.verify_ssl, config.proxy)
+    client = _client_registry.get(key)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=True,
+            verify=config.verify_ssl,
+            proxy=config.proxy,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+            timeout=httpx.Timeout(config.timeout)
+        )
+        _client_registry[key] = client
+    return client
+
+
+def _close_clients():
+    """Close all registered clients on their owning loops. Registered via atexit."""
+    for (loop, *_), client in list(_client_registry.items()):
+        if client.is_closed or loop.is_closed():
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(timeout=5)
+            else:
+                loop.run_until_complete(client.aclose())
+        except Exception:
+            pass
+    _client_registry.clear()
+
+
+atexit.register(_close_clients)
+
+
+@backoff.on_exception(
+    backoff.expo,
+    exception=(WebPageLoadError,
+        ConnectionError),
+    max_tries=Defaults.DEFAULT_MAX_RETRIES,
+    max_time=Defaults.DEFAULT_MAX_TIME,
+    on_backoff=backoff_handler_generic)
+@backoff.on_exception(
+    backoff.runtime,
+    exception=RateLimitExceededError,
+    value=retry_after_wait,
+    jitter=None,
+    max_tries=Defaults.DEFAULT_MAX_RETRIES,
+    max_time=Defaults.DEFAULT_MAX_TIME,
+    on_backoff=backoff_handler_generic)
+async def webscrape_httpx(
+        url: str,
+        config: Optional[WebscrapeConfig] = None,
+        client: Optional["httpx.AsyncClient"] = None,
+        on_success: Callable = None,
+        on_failure: Callable = None
+) -> ScrapedResponse:
+    """
+    Asynchronously fetch DOM contents of a web page over HTTP/2 using httpx.
+    SSRed HTML only, Cannot handle JS/CSR.
+
+    Unlike the aiohttp backend, concurrent requests to the same host are
+    multiplexed as streams over a single TLS connection, so same-host fan-outs
+    pay one handshake instead of one per connection.
+
+    Args:
+        url: URL to scrape
+        config: Webscraper Configuration of Class WebscrapeConfig
+        client: Optional httpx AsyncClient; defaults to a shared per-loop client
+        on_success: Callback function that will be called when the scrape succeeds
+        on_failure: Callback function that will be called with the exception if the scrape fails
+
+    Returns:
+        ScrapedResponse: Object containing the response and metadata
+
+    Raises:
+        ImportError: If the optional httpx dependency is not installed
+        InvalidURLError: If the URL is not valid
+        WebPageLoadError: If there was an error loading the web page
+        ContentTypeError: If the content type doesn't match expected type
+    """
+    if httpx is None:
+        raise ImportError(
+            "httpx is required for the httpx backend; install it with 'pip install yomika[http2]'"
+        )
+
+    start_time = time.monotonic()
+
+    if config is None:
+        config = _DEFAULT_CONFIG
+
+    # Validate URL
+    if not is_valid_url(url):
+        raise InvalidURLError(f"Invalid URL format: {url}")
+
+    # Apply rate limiting if configured, per host so slow hosts don't throttle others
+    if config.rate_limiter:
+        await config.rate_limiter.wait_async(url.split('/', 3)[2])
+
+    # Set up headers
+    headers = config.custom_headers or DEFAULT_HTTP_HEADERS
+
+    # Replay a fresh cached response, or prepare a conditional GET for a stale one
+    cache_key = None
+    if config.cache:
+        cache_key = config.cache.make_key('GET', url, headers)
+        cached_response = config.cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        cached_etag = config.cache.get_etag(cache_key)
+        if cached_etag:
+            headers = dict(headers)
+            headers['If-None-Match'] = cached_etag
+
+    try:
+        if client is None:
+            client = _get_client(config)
+
+        response = await client.get(
+            url,
+            headers=dict(headers),
+            params=config.params,
+            cookies=config.cookies,
+            follow_redirects=config.allow_redirects,
+            timeout=config.timeout
+        )
+
+        # Feed the status back to adaptive limiters so they can slow down on 429/503
+        observe = getattr(config.rate_limiter, 'observe', None)
+        if observe:
+            observe(response.status_code, response.headers.get('Retry-After'))
+
+        # Check for common rate limiting status codes
+        if response.status_code in RATE_LIMIT_STATUS_CODES:
+            raise RateLimitExceededError(
+                f"Rate limit exceeded: {response.status_code}",
+                retry_after=parse_retry_after(response.headers.get('Retry-After'))
+            )
+
+        # Revalidated: the stored entry is still good, return the cached body
+        if response.status_code == 304 and cache_key is not None:
+            stale_response = config.cache.get_stale(cache_key)
+            if stale_response is not None:
+                config.cache.refresh(cache_key, dict(response.headers))
+                return stale_response
+
+        # Raise for HTTP errors
+        response.raise_for_status()
+
+        content = response.content
+
+        # Check content type if expected type is provided; compare the mime
+        # token so parameters like charset can't cause spurious mismatches
+        content_type = response.headers.get('Content-Type', '')
+        if config.expected_content_type and not content_type_matches(config.expected_content_type, content_type):
+            raise ContentTypeError(
+                f"Expected content type '{config.expected_content_type}' but got '{content_type}'"
+            )
+
+        # Calculate elapsed time
+        elapsed_time = time.monotonic() - start_time
+
+        scrape_result = ScrapedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=content,
+            headers=MappingProxyType(dict(response.headers)) if config.snapshot_headers else response.headers,
+            elapsed_time=elapsed_time,
+            content_type=content_type,
+            success=True,
+            charset=response.charset_encoding
+        )
+
+        if cache_key is not None:
+            config.cache.set(cache_key, scrape_result)
+
+        safe_callback(on_success, scrape_result, 'on_success')
+
+        return scrape_result
+
+    # One consolidated handler for the client library's failure modes; message
+    # formatting is gated so disabled logging costs nothing on the retry path,
+    # and 'from e' chains the original exception instead of discarding it
+    except (httpx.ConnectError,
+            httpx.TimeoutException,
+            httpx.TooManyRedirects,
+            httpx.HTTPStatusError) as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to load %s: %s", url, e)
+        safe_callback(on_failure, e, 'on_failure')
+        raise WebPageLoadError(str(e)) from e
+
+    except ContentTypeError as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(str(e))
+        safe_callback(on_failure, e, 'on_failure')
+        raise
+
+    # Let the retry decorator see the rate-limit error (and its retry_after)
+    except RateLimitExceededError:
+        raise
+
+    except Exception as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Unexpected error while loading %s: %s", url, e)
+        safe_callback(on_failure, e, 'on_failure')
+        raise WebPageLoadError(str(e)) from e
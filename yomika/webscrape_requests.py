@@ -1,28 +1,77 @@
 import time
 import logging
+from types import MappingProxyType
+import atexit
+import threading
+from typing import Optional
 
 import requests
 import backoff
+from requests.adapters import HTTPAdapter
 
-from .defaults import Defaults
+from .defaults import Defaults, DEFAULT_HTTP_HEADERS, RATE_LIMIT_STATUS_CODES
 from .modules.url_validator import is_valid_url
-from .modules.utils import backoff_handler_generic
+from .modules.utils import backoff_handler_generic, content_type_matches, parse_retry_after, retry_after_wait
 from .exceptions import WebPageLoadError, ContentTypeError, InvalidURLError, RateLimitExceededError
 from .classes import ScrapedResponse, WebscrapeConfig
 
+logger = logging.getLogger(__name__)
+
+# Shared config (and thus rate limiter) for callers that don't pass their own
+_DEFAULT_CONFIG = WebscrapeConfig()
+
+# One pooled Session per thread, created lazily and reused across calls so
+# urllib3's connection pool survives between requests
+_thread_local = threading.local()
+_open_sessions: list[requests.Session] = []
+_open_sessions_lock = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the calling thread's shared Session, creating it on first use."""
+    session = getattr(_thread_local, 'session', None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=100, max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        _thread_local.session = session
+        with _open_sessions_lock:
+            _open_sessions.append(session)
+    return session
+
+
+def _close_sessions():
+    """Close every thread-local session. Registered via atexit."""
+    with _open_sessions_lock:
+        for session in _open_sessions:
+            session.close()
+        _open_sessions.clear()
+
+
+atexit.register(_close_sessions)
+
 
 @backoff.on_exception(
     backoff.expo,
     exception=(WebPageLoadError,
                requests.RequestException,
-               RateLimitExceededError,
                ConnectionError),
     max_tries=Defaults.DEFAULT_MAX_RETRIES,
     max_time=Defaults.DEFAULT_MAX_TIME,
     on_backoff=backoff_handler_generic)
+@backoff.on_exception(
+    backoff.runtime,
+    exception=RateLimitExceededError,
+    value=retry_after_wait,
+    jitter=None,
+    max_tries=Defaults.DEFAULT_MAX_RETRIES,
+    max_time=Defaults.DEFAULT_MAX_TIME,
+    on_backoff=backoff_handler_generic)
 def webscrape_requests(
         url: str,
-        config: WebscrapeConfig = WebscrapeConfig
+        config: Optional[WebscrapeConfig] = None,
+        session: Optional[requests.Session] = None
 ) -> ScrapedResponse:
     """
     Fetch DOM contents of a web page. SSRed HTML only, Cannot handle JS/CSR.
@@ -39,6 +88,7 @@ def webscrape_requests(
             # expected_content_type: Expected content type (e.g., 'text/html')
             # proxy: Proxy configuration dict (e.g., {'http': 'http://proxy.com:8080'})
             # rate_limiter: Optional rate limiter object
+        session: Optional requests Session for connection pooling
 
     Returns:
         ScrapedResponse: Object containing the response and metadata
@@ -48,99 +98,137 @@ def webscrape_requests(
         WebPageLoadError: If there was an error loading the web page
         ContentTypeError: If the content type doesn't match expected type
     """
-    start_time = time.time()
-    error_message = None
+    start_time = time.monotonic()
 
-    if config.rate_limiter:
-        config.rate_limiter.wait()
+    if config is None:
+        config = _DEFAULT_CONFIG
 
     # Validate URL
     if not is_valid_url(url):
         raise InvalidURLError(f"Invalid URL format: {url}")
 
+    # Apply rate limiting if configured, per host so slow hosts don't throttle others
+    if config.rate_limiter:
+        config.rate_limiter.wait(url.split('/', 3)[2])
+
     # Set up headers
-    headers = config.custom_headers or Defaults.DEFAULT_HTTP_HEADERS
+    headers = config.custom_headers or DEFAULT_HTTP_HEADERS
+
+    # Replay a fresh cached response, or prepare a conditional GET for a stale one
+    cache_key = None
+    if config.cache:
+        cache_key = config.cache.make_key('GET', url, headers)
+        cached_response = config.cache.get(cache_key)
+        if cached_response is not None:
+            return cached_response
+        cached_etag = config.cache.get_etag(cache_key)
+        if cached_etag:
+            headers = dict(headers)
+            headers['If-None-Match'] = cached_etag
 
     try:
-        with requests.Session() as session:
-            response = session.get(
-                url,
-                headers=headers,
-                params=config.params,
-                cookies=config.cookies,
-                timeout=config.timeout,
-                allow_redirects=config.allow_redirects,
-                verify=config.verify_ssl,
-                proxies=config.proxy
+        # Use provided session or the calling thread's shared one
+        if session is None:
+            session = _get_session()
+
+        response = session.get(
+            url,
+            headers=headers,
+            params=config.params,
+            cookies=config.cookies,
+            timeout=config.timeout,
+            allow_redirects=config.allow_redirects,
+            verify=config.verify_ssl,
+            proxies=config.proxy,
+            stream=config.stream
+        )
+
+        # Feed the status back to adaptive limiters so they can slow down on 429/503
+        observe = getattr(config.rate_limiter, 'observe', None)
+        if observe:
+            observe(response.status_code, response.headers.get('Retry-After'))
+
+        # Revalidated: the stored entry is still good, return the cached body
+        if response.status_code == 304 and cache_key is not None:
+            stale_response = config.cache.get_stale(cache_key)
+            if stale_response is not None:
+                config.cache.refresh(cache_key, dict(response.headers))
+                response.close()
+                return stale_response
+
+        # Check for common rate limiting status codes before raise_for_status,
+        # which would otherwise turn them into plain HTTPErrors and lose the
+        # Retry-After delay the retry decorator waits on
+        if response.status_code in RATE_LIMIT_STATUS_CODES:
+            raise RateLimitExceededError(
+                f"Rate limit exceeded: {response.status_code}",
+                retry_after=parse_retry_after(response.headers.get('Retry-After'))
             )
 
-            # Raise for HTTP errors
-            response.raise_for_status()
-
-            # Check content type if expected type is provided
-            if config.expected_content_type and config.expected_content_type not in response.headers.get('Content-Type', ''):
-                raise ContentTypeError(
-                    f"Expected content type '{config.expected_content_type}' but got "
-                    f"'{response.headers.get('Content-Type')}'"
-                )
-
-            # Get actual response time
-            elapsed_time = time.time() - start_time
-
-            # Check for common rate limiting status codes
-            if response.status_code in (429, 503):
-                raise RateLimitExceededError(f"Rate limit exceeded: {response.status_code}")
-
-            return ScrapedResponse(
-                url=url,
-                status_code=response.status_code,
-                content=response.content,
-                text=response.text,
-                headers=dict(response.headers),
-                elapsed_time=elapsed_time,
-                content_type=response.headers.get('Content-Type', ''),
-                success=True
-            )
+        # Raise for HTTP errors
+        response.raise_for_status()
 
-    except requests.exceptions.ConnectionError as e:
-        error_message = f"Connection error for {url}: {str(e)}"
-        logging.error(error_message)
-        raise WebPageLoadError(error_message)
-
-    except requests.exceptions.Timeout as e:
-        error_message = f"Timeout error for {url}: {str(e)}"
-        logging.error(error_message)
-        raise WebPageLoadError(error_message)
-
-    except requests.exceptions.TooManyRedirects as e:
-        error_message = f"Too many redirects for {url}: {str(e)}"
-        logging.error(error_message)
-        raise WebPageLoadError(error_message)
+        # Check content type if expected type is provided; compare the mime
+        # token so parameters like charset can't cause spurious mismatches
+        if config.expected_content_type and not content_type_matches(
+                config.expected_content_type, response.headers.get('Content-Type', '')):
+            raise ContentTypeError(
+                f"Expected content type '{config.expected_content_type}' but got "
+                f"'{response.headers.get('Content-Type')}'"
+            )
 
-    except requests.exceptions.HTTPError as e:
-        error_message = f"HTTP error for {url}: {str(e)}"
-        logging.error(error_message)
-        raise WebPageLoadError(error_message)
+        # Read the body in bounded chunks when streaming, else in one shot
+        if config.stream:
+            buffer = bytearray()
+            for chunk in response.iter_content(config.chunk_size):
+                buffer.extend(chunk)
+            content = bytes(buffer)
+        else:
+            content = response.content
+
+        # Get actual response time
+        elapsed_time = time.monotonic() - start_time
+
+        scrape_result = ScrapedResponse(
+            url=url,
+            status_code=response.status_code,
+            content=content,
+            headers=MappingProxyType(dict(response.headers)) if config.snapshot_headers else response.headers,
+            elapsed_time=elapsed_time,
+            content_type=response.headers.get('Content-Type', ''),
+            success=True,
+            # Only trust encoding when the header declared one; requests
+            # defaults to ISO-8859-1 for text/* otherwise, which would defeat
+            # the utf-8 fallback in ScrapedResponse.text
+            charset=response.encoding if 'charset' in response.headers.get('Content-Type', '') else None
+        )
+
+        if cache_key is not None:
+            config.cache.set(cache_key, scrape_result)
+
+        return scrape_result
+
+    # One consolidated handler for the client library's failure modes; message
+    # formatting is gated so disabled logging costs nothing on the retry path,
+    # and 'from e' chains the original exception instead of discarding it
+    except (requests.exceptions.ConnectionError,
+            requests.exceptions.Timeout,
+            requests.exceptions.TooManyRedirects,
+            requests.exceptions.HTTPError) as e:
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Failed to load %s: %s", url, e)
+        raise WebPageLoadError(str(e)) from e
 
     except ContentTypeError as e:
-        error_message = str(e)
-        logging.error(error_message)
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error(str(e))
+        raise
+
+    # Let the retry decorator see the rate-limit error (and its retry_after)
+    except RateLimitExceededError:
         raise
 
     except Exception as e:
-        error_message = f"Unexpected error while loading {url}: {str(e)}"
-        logging.error(error_message)
-        raise WebPageLoadError(error_message)
-
-    # This code shouldn't be reached
-    return ScrapedResponse(
-        url=url,
-        status_code=0,
-        content=b'',
-        text='',
-        headers={},
-        elapsed_time=time.time() - start_time,
-        content_type='',
-        success=False,
-        error=error_message
-    )
+        if logger.isEnabledFor(logging.ERROR):
+            logger.error("Unexpected error while loading %s: %s", url, e)
+        raise WebPageLoadError(str(e)) from e